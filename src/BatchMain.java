@@ -0,0 +1,45 @@
+//package src;
+
+import java.io.BufferedReader;
+import java.io.FileReader;
+
+/**
+ * Batch dispatcher for the test runner: processes a manifest of
+ * "inputPath<TAB>outputPath" lines back-to-back in one JVM, paying startup
+ * once per batch instead of once per case. Prints one status line per case
+ * on stdout: "OK<TAB>nanos" or "ERR<TAB>nanos<TAB>message". Cases run
+ * through MainLoop.runCase, so each one still starts from clean Main state.
+ */
+public class BatchMain {
+
+    public static void main(String[] args) throws Exception {
+        if (args.length != 1) {
+            System.err.println("Usage: java BatchMain <manifest_file>");
+            return;
+        }
+
+        try (BufferedReader manifest = new BufferedReader(new FileReader(args[0]))) {
+            String line;
+            while ((line = manifest.readLine()) != null) {
+                line = line.trim();
+                if (line.isEmpty()) continue;
+
+                int tab = line.indexOf('\t');
+                if (tab < 0) {
+                    System.out.println("ERR\t0\tMalformed manifest line: " + line);
+                    System.out.flush();
+                    continue;
+                }
+
+                long start = System.nanoTime();
+                try {
+                    MainLoop.runCase(line.substring(0, tab), line.substring(tab + 1));
+                    System.out.println("OK\t" + (System.nanoTime() - start));
+                } catch (Throwable t) {
+                    System.out.println("ERR\t" + (System.nanoTime() - start) + "\t" + t);
+                }
+                System.out.flush();
+            }
+        }
+    }
+}
@@ -0,0 +1,58 @@
+//package src;
+
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.InputStreamReader;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.URL;
+import java.net.URLClassLoader;
+
+/**
+ * Long-lived dispatcher for the test runner so JVM startup is paid once per
+ * worker instead of once per test case. Reads one "inputPath<TAB>outputPath"
+ * request per line from stdin, runs Main on it, and acknowledges each request
+ * with "DONE" (or "ERR<TAB>message") on stdout. Exits on EOF or a blank line.
+ *
+ * Main keeps the network state in static fields, so each request loads Main
+ * through a fresh class loader to start from a clean slate.
+ */
+public class MainLoop {
+
+    public static void runCase(String inputPath, String outputPath) throws Exception {
+        URL classpath = new File(".").toURI().toURL();
+        try (URLClassLoader loader = new URLClassLoader(new URL[]{classpath},
+                ClassLoader.getPlatformClassLoader())) {
+            Class<?> mainClass = loader.loadClass("Main");
+            Method mainMethod = mainClass.getMethod("main", String[].class);
+            mainMethod.invoke(null, (Object) new String[]{inputPath, outputPath});
+        } catch (InvocationTargetException e) {
+            Throwable cause = e.getCause();
+            throw (cause instanceof Exception) ? (Exception) cause : e;
+        }
+    }
+
+    public static void main(String[] args) throws Exception {
+        BufferedReader requests = new BufferedReader(new InputStreamReader(System.in));
+        String line;
+        while ((line = requests.readLine()) != null) {
+            line = line.trim();
+            if (line.isEmpty()) break;
+
+            int tab = line.indexOf('\t');
+            if (tab < 0) {
+                System.out.println("ERR\tMalformed request: " + line);
+                System.out.flush();
+                continue;
+            }
+
+            try {
+                runCase(line.substring(0, tab), line.substring(tab + 1));
+                System.out.println("DONE");
+            } catch (Throwable t) {
+                System.out.println("ERR\t" + t);
+            }
+            System.out.flush();
+        }
+    }
+}
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Regression tests for the test runner itself.
+
+Run with: python -m unittest test_tester
+"""
+
+import subprocess
+import sys
+import unittest
+
+import tester
+
+
+class JavaDaemonTimeoutTest(unittest.TestCase):
+    """A timed-out case must not poison the tests that follow it."""
+
+    def make_stuck_daemon(self):
+        """Build a JavaDaemon around a child that never acknowledges"""
+        daemon = tester.JavaDaemon.__new__(tester.JavaDaemon)
+        daemon.process = subprocess.Popen(
+            [sys.executable, '-c', 'import time; time.sleep(30)'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        return daemon
+
+    def test_timeout_reaps_daemon_so_next_test_respawns(self):
+        daemon = self.make_stuck_daemon()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            daemon.run('in.txt', 'out.txt', timeout=0.2)
+        # The killed daemon must be reaped before run() raises; otherwise
+        # alive() still sees poll() == None and get_worker_daemon() hands the
+        # dead daemon to the next test, which then fails with a bogus
+        # "Java daemon died unexpectedly" runtime error without running.
+        self.assertFalse(daemon.alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
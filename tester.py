@@ -9,7 +9,8 @@ Usage:
     python test_runner.py --type type2 # Test only type2 cases
     python test_runner.py --verbose    # Show detailed diffs
     python test_runner.py --benchmark  # Benchmark mode: only measure times
-    
+    python test_runner.py --jobs 4     # Run up to 4 test cases in parallel
+
 """
 
 import os
@@ -17,8 +18,15 @@ import sys
 import subprocess
 import time
 import argparse
+import concurrent.futures
 import glob
-import filecmp
+import atexit
+import hashlib
+import json
+import mmap
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 
 # Configuration
@@ -27,6 +35,9 @@ OUTPUT_DIR = "output"
 TESTCASE_INPUT_DIR = "testcase_inputs"
 TESTCASE_OUTPUT_DIR = "testcase_outputs"
 MAIN_CLASS = "Main"
+DAEMON_CLASS = "MainLoop"
+BATCH_CLASS = "BatchMain"
+CACHE_FILE = ".test_cache.json"
 
 # Colors for cross-platform output
 class Colors:
@@ -42,18 +53,14 @@ class Colors:
         else:
             # Unix-like systems generally support ANSI colors
             self.enabled = True
-    
-    def __getattr__(self, name):
-        colors = {
-            'GREEN': '\033[0;32m',
-            'RED': '\033[0;31m', 
-            'YELLOW': '\033[1;33m',
-            'BLUE': '\033[0;34m',
-            'NC': '\033[0m'  # No Color
-        }
-        if self.enabled and name in colors:
-            return colors[name]
-        return ''
+
+        # Precompute the escape codes once; every log line reads these, so
+        # they are plain attributes rather than a per-access __getattr__
+        self.GREEN = '\033[0;32m' if self.enabled else ''
+        self.RED = '\033[0;31m' if self.enabled else ''
+        self.YELLOW = '\033[1;33m' if self.enabled else ''
+        self.BLUE = '\033[0;34m' if self.enabled else ''
+        self.NC = '\033[0m' if self.enabled else ''  # No Color
 
 colors = Colors()
 
@@ -77,140 +84,435 @@ def ensure_directory(path):
     """Create directory if it doesn't exist"""
     Path(path).mkdir(parents=True, exist_ok=True)
 
-def compile_java():
-    """Compile Java sources"""
+def start_compile():
+    """Launch javac in the background and return its process handle.
+
+    Compilation overlaps with test discovery and worker-pool warmup; callers
+    must pass the handle through finish_compile() before running any test.
+    Returns True when the compiled classes are already up to date (no javac
+    needed), or None if compilation could not be started.
+    """
     log_info("Compiling Java sources...")
-    
+
     if not os.path.exists(SRC_DIR):
         log_error(f"✗ Source directory '{SRC_DIR}' not found")
-        return False
-    
+        return None
+
     # Find all .java files
     java_files = glob.glob(os.path.join(SRC_DIR, "*.java"))
     if not java_files:
         log_error(f"✗ No Java files found in '{SRC_DIR}'")
-        return False
-    
+        return None
+
+    # Skip javac when every .class file is strictly newer than the newest
+    # source — the common edit-loop case, since clean_outputs leaves classes
+    # in place. Empty .class files are never trusted, and a strict > keeps a
+    # fresh checkout (where everything shares one mtime) compiling.
+    try:
+        newest_source = max(os.stat(f).st_mtime for f in java_files)
+        class_stats = [os.stat(os.path.splitext(f)[0] + ".class") for f in java_files]
+        if (all(stat.st_size > 0 for stat in class_stats)
+                and min(stat.st_mtime for stat in class_stats) > newest_source):
+            log_success("✓ Compiled classes are up to date")
+            return True
+    except OSError:
+        pass  # Missing .class files: compile
+
     try:
         # Compile all Java files
         cmd = ["javac"] + [os.path.basename(f) for f in java_files]
-        result = subprocess.run(cmd, cwd=SRC_DIR, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            log_error("✗ Compilation failed:")
-            if result.stderr:
-                print("Compilation errors:")
-                print(result.stderr)
-            if result.stdout:
-                print(result.stdout)
-            return False
-        
-        log_success("✓ Compilation successful")
-        return True
-        
+        return subprocess.Popen(cmd, cwd=SRC_DIR, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True)
+
     except FileNotFoundError:
         log_error("✗ javac not found. Please ensure Java SDK is installed and in PATH")
-        return False
+        return None
     except Exception as e:
         log_error(f"✗ Compilation error: {e}")
+        return None
+
+def finish_compile(javac_process):
+    """Wait for the javac launched by start_compile() and report the outcome"""
+    if javac_process is True:  # Classes were already up to date, no javac ran
+        return True
+
+    stdout, stderr = javac_process.communicate()
+
+    if javac_process.returncode != 0:
+        log_error("✗ Compilation failed:")
+        if stderr:
+            print("Compilation errors:")
+            print(stderr)
+        if stdout:
+            print(stdout)
         return False
 
+    log_success("✓ Compilation successful")
+    return True
+
 def get_test_files(test_type=None):
     """Get list of test input files, optionally filtered by type"""
     if not os.path.exists(TESTCASE_INPUT_DIR):
         return []
-    
-    pattern = "*.txt"
-    if test_type:
-        pattern = f"{test_type}_*.txt"
-    
-    input_files = glob.glob(os.path.join(TESTCASE_INPUT_DIR, pattern))
+
+    # A single scandir pass replaces glob's per-entry pattern matching
+    prefix = f"{test_type}_" if test_type else ""
+    input_files = [entry.path for entry in os.scandir(TESTCASE_INPUT_DIR)
+                   if entry.is_file() and entry.name.endswith('.txt')
+                   and entry.name.startswith(prefix)]
     return sorted(input_files)
 
-def run_single_test(input_file, verbose=False, benchmark=False):
-    """Run a single test case and return result"""
+def get_expected_names():
+    """Collect available expected-output filenames in one directory scan"""
+    if not os.path.isdir(TESTCASE_OUTPUT_DIR):
+        return set()
+    return {entry.name for entry in os.scandir(TESTCASE_OUTPUT_DIR) if entry.is_file()}
+
+class JavaDaemon:
+    """A long-lived `java MainLoop` process that runs test cases on request.
+
+    Spawning a fresh JVM per test pays classloader and JIT warmup costs every
+    time; keeping one warm JVM per worker amortizes that across all its cases.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ["java", DAEMON_CLASS],
+            cwd=SRC_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+
+    def alive(self):
+        """Check whether the daemon process is still running"""
+        return self.process.poll() is None
+
+    def close(self):
+        """Shut the daemon down (it exits on EOF)"""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.wait()
+
+    def run(self, input_file, output_file, timeout=30):
+        """Run one test case through the daemon.
+
+        Returns (ok, duration, error_message). Raises subprocess.TimeoutExpired
+        if the case exceeds the timeout (the daemon is killed and respawned by
+        the next get_worker_daemon() call).
+        """
+        request = f"{os.path.abspath(input_file)}\t{os.path.abspath(output_file)}\n"
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            self.process.kill()
+
+        killer = threading.Timer(timeout, kill_on_timeout)
+        killer.start()
+        start_time = time.perf_counter_ns()
+        try:
+            self.process.stdin.write(request)
+            self.process.stdin.flush()
+            ack = self.process.stdout.readline()
+        except (OSError, ValueError):
+            ack = ''
+        finally:
+            killer.cancel()
+        duration = (time.perf_counter_ns() - start_time) / 1e9
+
+        if timed_out.is_set():
+            # Reap the killed daemon before raising: until the child is
+            # waited on, poll() still returns None and get_worker_daemon()
+            # would hand the dead daemon to the next test, failing it with a
+            # bogus runtime error instead of respawning.
+            self.process.wait()
+            raise subprocess.TimeoutExpired(["java", DAEMON_CLASS], timeout)
+
+        ack = ack.rstrip('\n')
+        if ack == 'DONE':
+            return True, duration, ''
+        if ack.startswith('ERR\t'):
+            return False, duration, ack.split('\t', 1)[1]
+        return False, duration, 'Java daemon died unexpectedly'
+
+def files_identical(expected_file, actual_file):
+    """Compare two files byte-for-byte.
+
+    Opens each file exactly once with os.open and sizes them from the open
+    descriptors with os.fstat, failing fast on a size mismatch with zero
+    bytes read. Small files are compared in 64 KiB os.read blocks that
+    short-circuit on the first difference; files of 1 MiB and up are
+    memory-mapped so the whole compare runs in libc memcmp.
+    """
+    expected_fd = os.open(expected_file, os.O_RDONLY)
+    try:
+        actual_fd = os.open(actual_file, os.O_RDONLY)
+        try:
+            size = os.fstat(expected_fd).st_size
+            if size != os.fstat(actual_fd).st_size:
+                return False
+            if size == 0:
+                return True
+
+            if size >= 1 << 20:
+                with mmap.mmap(expected_fd, 0, access=mmap.ACCESS_READ) as expected_map, \
+                     mmap.mmap(actual_fd, 0, access=mmap.ACCESS_READ) as actual_map:
+                    return memoryview(expected_map) == memoryview(actual_map)
+
+            while True:
+                expected_block = os.read(expected_fd, 65536)
+                actual_block = os.read(actual_fd, 65536)
+                if expected_block != actual_block:
+                    return False
+                if not expected_block:
+                    return True
+        finally:
+            os.close(actual_fd)
+    finally:
+        os.close(expected_fd)
+
+def load_cache():
+    """Load the expected-output digest cache persisted by previous runs"""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    """Persist the expected-output digest cache for the next run"""
+    try:
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def file_digest(path):
+    """Compute the SHA-256 digest of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+def outputs_match(expected_file, actual_file, cache, result):
+    """Check whether the actual output matches the expected one.
+
+    Expected outputs rarely change between runs, so their SHA-256 digests are
+    cached keyed by (mtime, size): on a cache hit only the actual file is
+    read and its digest compared against the cached one — halving
+    verification I/O. On a miss (or without a cache) the files are compared
+    directly through files_identical, which short-circuits on the first
+    difference, and the expected digest is computed once and reported through
+    result['cache_update'] so the parent process can fold it into the
+    persistent cache for the next run.
+    """
+    if cache is None:
+        return files_identical(expected_file, actual_file)
+
+    expected_stat = os.stat(expected_file)
+    cached = cache.get(expected_file)
+    if cached and cached[0] == expected_stat.st_mtime_ns and cached[1] == expected_stat.st_size:
+        if os.stat(actual_file).st_size != expected_stat.st_size:
+            return False
+        return file_digest(actual_file) == cached[2]
+
+    result['cache_update'] = [expected_file, expected_stat.st_mtime_ns,
+                              expected_stat.st_size, file_digest(expected_file)]
+    return files_identical(expected_file, actual_file)
+
+# Parent-created tmpfs root for this run's benchmark outputs, and each
+# process's private directory beneath it
+_bench_root = None
+_bench_dir = None
+
+def init_bench_root():
+    """Create the parent-owned tmpfs root for this run's benchmark outputs.
+
+    Must run in the parent before the worker pool forks: pool workers exit
+    via os._exit and never run their own atexit handlers, so cleanup has to
+    be owned by the parent. Workers inherit the root at fork time and create
+    their private directories beneath it, and one parent-side atexit handler
+    removes the whole tree. Returns None when no tmpfs is available
+    (non-Linux systems).
+    """
+    global _bench_root
+    if _bench_root is None and os.path.isdir('/dev/shm'):
+        _bench_root = tempfile.mkdtemp(prefix='tester_', dir='/dev/shm')
+        atexit.register(shutil.rmtree, _bench_root, ignore_errors=True)
+    return _bench_root
+
+def get_bench_dir():
+    """Return this process's RAM-backed directory for benchmark outputs.
+
+    In benchmark mode the output file is never compared, so writing it to
+    tmpfs keeps disk writeback out of the measured duration. Returns None
+    when init_bench_root() has not run (or found no tmpfs) in this process's
+    ancestry.
+    """
+    global _bench_dir
+    if _bench_dir is None and _bench_root is not None:
+        _bench_dir = tempfile.mkdtemp(dir=_bench_root)
+    return _bench_dir
+
+# One daemon per process: the main process when running sequentially, or each
+# pool worker when running in parallel.
+_worker_daemon = None
+
+def get_worker_daemon():
+    """Return this process's JVM daemon, (re)spawning it if needed.
+
+    Returns None if the daemon dispatcher is not compiled, in which case the
+    caller falls back to one `java Main` process per test.
+    """
+    global _worker_daemon
+    if _worker_daemon is not None and not _worker_daemon.alive():
+        _worker_daemon.close()
+        _worker_daemon = None
+    if _worker_daemon is None:
+        if not os.path.exists(os.path.join(SRC_DIR, f"{DAEMON_CLASS}.class")):
+            return None
+        try:
+            _worker_daemon = JavaDaemon()
+        except OSError:
+            return None
+    return _worker_daemon
+
+def new_result(input_file, bench_dir=None):
+    """Build the result skeleton shared by the single and batch runners"""
     basename = os.path.splitext(os.path.basename(input_file))[0]
-    expected_file = os.path.join(TESTCASE_OUTPUT_DIR, f"{basename}_out.txt")
-    actual_file = os.path.join(OUTPUT_DIR, f"{basename}.txt")
-    
-    result = {
+    if bench_dir is not None:
+        # Benchmark outputs go to tmpfs when available; they are deleted
+        # right after the duration is recorded
+        actual_file = os.path.join(bench_dir, f"{basename}.txt")
+    else:
+        actual_file = os.path.join(OUTPUT_DIR, f"{basename}.txt")
+
+    return {
         'name': basename,
         'input_file': input_file,
-        'expected_file': expected_file,
+        'expected_file': os.path.join(TESTCASE_OUTPUT_DIR, f"{basename}_out.txt"),
         'actual_file': actual_file,
         'status': 'unknown',
         'duration': 0,
         'error_message': ''
     }
-    
-    # In benchmark mode, skip expected output check
-    if not benchmark and not os.path.exists(expected_file):
+
+def mark_skipped_if_no_expected(result, expected_names):
+    """Mark a test as skipped when its expected output file is missing"""
+    if expected_names is not None:
+        has_expected = f"{result['name']}_out.txt" in expected_names
+    else:
+        has_expected = os.path.exists(result['expected_file'])
+    if not has_expected:
         result['status'] = 'skip'
         result['error_message'] = 'No expected output file'
+        return True
+    return False
+
+def finish_test(result, verbose=False, benchmark=False, cache=None, bench_dir=None):
+    """Verify a finished Java run and fill in the final test status"""
+    expected_file = result['expected_file']
+    actual_file = result['actual_file']
+
+    # Check if output file was created
+    if not os.path.exists(actual_file):
+        result['status'] = 'no_output'
+        result['error_message'] = 'No output file generated'
         return result
-    
-    try:
-        # Run the Java program
-        cmd = ["java", MAIN_CLASS, f"../{input_file}", f"../{actual_file}"]
-        
-        start_time = time.time()
-        process_result = subprocess.run(
-            cmd, 
-            cwd=SRC_DIR,
-            capture_output=True,
-            text=True,
-            timeout=30  # 30 second timeout
-        )
-        end_time = time.time()
-        
-        result['duration'] = end_time - start_time
-        
-        # Check exit code
-        if process_result.returncode != 0:
-            result['status'] = 'runtime_error'
-            result['error_message'] = f"Exit code: {process_result.returncode}"
-            if process_result.stderr:
-                result['error_message'] += f"\nStderr: {process_result.stderr.strip()}"
-            return result
-        
-        # Check if output file was created
-        if not os.path.exists(actual_file):
-            result['status'] = 'no_output'
-            result['error_message'] = 'No output file generated'
-            return result
-        
-        # In benchmark mode, just mark as completed without comparison
-        if benchmark:
-            result['status'] = 'benchmark_complete'
+
+    # In benchmark mode, just mark as completed without comparison
+    if benchmark:
+        result['status'] = 'benchmark_complete'
+        if bench_dir is not None:
+            try:
+                os.remove(actual_file)
+            except OSError:
+                pass
+    else:
+        # Compare files
+        if outputs_match(expected_file, actual_file, cache, result):
+            result['status'] = 'pass'
         else:
-            # Compare files
-            if filecmp.cmp(expected_file, actual_file, shallow=False):
-                result['status'] = 'pass'
-            else:
-                result['status'] = 'wrong_output'
-                
-                # Generate diff for verbose mode
-                if verbose:
-                    try:
-                        with open(expected_file, 'r') as f:
-                            expected_content = f.read()
-                        with open(actual_file, 'r') as f:
-                            actual_content = f.read()
-                        
-                        import difflib
-                        diff = list(difflib.unified_diff(
-                            expected_content.splitlines(keepends=True),
-                            actual_content.splitlines(keepends=True),
-                            fromfile='expected',
-                            tofile='actual',
-                            n=3
-                        ))
-                        result['diff'] = ''.join(diff[:20])  # Limit diff output
-                    except Exception:
-                        result['diff'] = "Could not generate diff"
-        
+            result['status'] = 'wrong_output'
+
+            # Generate diff for verbose mode. Only the first 64 KiB of
+            # each file is read: the diff is truncated to 20 lines anyway,
+            # and this caps the line splitting and diff computation no
+            # matter how large the outputs are.
+            if verbose:
+                try:
+                    with open(expected_file, 'r') as f:
+                        expected_content = f.read(65536)
+                    with open(actual_file, 'r') as f:
+                        actual_content = f.read(65536)
+
+                    import difflib
+                    diff = list(difflib.unified_diff(
+                        expected_content.splitlines(keepends=True),
+                        actual_content.splitlines(keepends=True),
+                        fromfile='expected',
+                        tofile='actual',
+                        n=3
+                    ))
+                    result['diff'] = ''.join(diff[:20])  # Limit diff output
+                    if not result['diff']:
+                        result['diff'] = '(outputs differ beyond the first 64 KiB)'
+                except Exception:
+                    result['diff'] = "Could not generate diff"
+
+    return result
+
+def run_single_test(input_file, verbose=False, benchmark=False, cache=None, expected_names=None):
+    """Run a single test case and return result"""
+    bench_dir = get_bench_dir() if benchmark else None
+    result = new_result(input_file, bench_dir)
+    actual_file = result['actual_file']
+
+    if not benchmark and mark_skipped_if_no_expected(result, expected_names):
         return result
-        
+
+    try:
+        # Run the Java program through this worker's warm JVM daemon
+        daemon = get_worker_daemon()
+        if daemon is not None:
+            ok, duration, error_message = daemon.run(input_file, actual_file)
+            result['duration'] = duration
+
+            if not ok:
+                result['status'] = 'runtime_error'
+                result['error_message'] = error_message
+                return result
+        else:
+            # Fallback: one JVM per test (daemon dispatcher not compiled)
+            cmd = ["java", MAIN_CLASS, os.path.abspath(input_file), os.path.abspath(actual_file)]
+
+            # stdout is never consumed, and in benchmark mode stderr is
+            # dropped too so no pipe drain skews the measured wallclock
+            start_time = time.perf_counter_ns()
+            process_result = subprocess.run(
+                cmd,
+                cwd=SRC_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL if benchmark else subprocess.PIPE,
+                text=True,
+                timeout=30  # 30 second timeout
+            )
+            end_time = time.perf_counter_ns()
+
+            result['duration'] = (end_time - start_time) / 1e9
+
+            # Check exit code
+            if process_result.returncode != 0:
+                result['status'] = 'runtime_error'
+                result['error_message'] = f"Exit code: {process_result.returncode}"
+                if process_result.stderr:
+                    result['error_message'] += f"\nStderr: {process_result.stderr.strip()}"
+                return result
+
+        return finish_test(result, verbose, benchmark, cache, bench_dir)
+
     except subprocess.TimeoutExpired:
         result['status'] = 'timeout'
         result['error_message'] = 'Test timed out (30s limit)'
@@ -220,8 +522,134 @@ def run_single_test(input_file, verbose=False, benchmark=False):
         result['error_message'] = str(e)
         return result
 
-def run_tests(test_type=None, verbose=False, benchmark=False):
-    """Run all tests and return summary"""
+def run_batch(input_files, verbose=False, benchmark=False, cache=None, expected_names=None):
+    """Run a chunk of test cases through one BatchMain JVM invocation.
+
+    Writes the chunk as a "inputPath<TAB>outputPath" manifest, invokes
+    `java BatchMain manifest` once, and recovers per-case durations from the
+    nanosecond status lines BatchMain prints. Pays JVM startup once per batch
+    instead of once per case.
+    """
+    bench_dir = get_bench_dir() if benchmark else None
+    results = []
+    batch = []  # Results whose cases go into the manifest
+
+    for input_file in input_files:
+        result = new_result(input_file, bench_dir)
+        results.append(result)
+        if not benchmark and mark_skipped_if_no_expected(result, expected_names):
+            continue
+        batch.append(result)
+
+    if not batch:
+        return results
+
+    manifest = tempfile.NamedTemporaryFile(mode='w', suffix='.manifest', delete=False)
+    try:
+        for result in batch:
+            manifest.write(f"{os.path.abspath(result['input_file'])}\t"
+                           f"{os.path.abspath(result['actual_file'])}\n")
+        manifest.close()
+
+        status_lines = []
+        try:
+            process_result = subprocess.run(
+                ["java", BATCH_CLASS, manifest.name],
+                cwd=SRC_DIR,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=30 * len(batch)  # 30 second timeout per case
+            )
+            status_lines = process_result.stdout.splitlines()
+        except subprocess.TimeoutExpired as e:
+            # TimeoutExpired carries raw bytes on POSIX even when run() used
+            # text=True, but an already-decoded str on Windows
+            if e.stdout:
+                partial = e.stdout
+                if isinstance(partial, bytes):
+                    partial = partial.decode(errors='replace')
+                status_lines = partial.splitlines()
+        except Exception as e:
+            for result in batch:
+                result['status'] = 'error'
+                result['error_message'] = str(e)
+            return results
+
+        for i, result in enumerate(batch):
+            fields = status_lines[i].split('\t', 2) if i < len(status_lines) else []
+            if fields and fields[0] == 'OK':
+                result['duration'] = int(fields[1]) / 1e9
+                # Degrade to an error result like run_single_test does rather
+                # than letting verification exceptions escape the worker
+                try:
+                    finish_test(result, verbose, benchmark, cache, bench_dir)
+                except Exception as e:
+                    result['status'] = 'error'
+                    result['error_message'] = str(e)
+            elif fields and fields[0] == 'ERR':
+                result['duration'] = int(fields[1]) / 1e9
+                result['status'] = 'runtime_error'
+                result['error_message'] = fields[2] if len(fields) > 2 else ''
+            else:
+                # No status line: the batch timed out or died before this case
+                result['status'] = 'timeout'
+                result['error_message'] = 'Batch timed out or exited early'
+    finally:
+        try:
+            os.remove(manifest.name)
+        except OSError:
+            pass
+
+    return results
+
+def run_task(input_files, verbose=False, benchmark=False, cache=None, expected_names=None,
+             batch_size=None):
+    """Run one worker's slice of the test list and return its results"""
+    if batch_size:
+        return run_batch(input_files, verbose, benchmark, cache, expected_names)
+    return [run_single_test(input_file, verbose, benchmark, cache, expected_names)
+            for input_file in input_files]
+
+def format_result(index, result, verbose=False, benchmark=False):
+    """Format the outcome of a finished test.
+
+    Returns (category, text): the summary category to count it under and the
+    progress output as one string, so the caller can batch completed lines
+    into a single stdout write instead of flushing per test.
+    """
+    action = "Benchmarking" if benchmark else "Testing"
+    name = result['name']
+    status = result['status']
+
+    if verbose:
+        text = f"{colors.BLUE}[{index}] {action}: {name}{colors.NC}\n"
+        if status == 'skip':
+            return 'skipped', text + f"{colors.YELLOW}⚠ SKIP: {result['error_message']}{colors.NC}\n\n"
+        if status == 'benchmark_complete':
+            return 'completed', text + f"{colors.GREEN}✓ COMPLETED (Time: {result['duration']:.3f}s){colors.NC}\n\n"
+        if status == 'pass':
+            return 'passed', text + f"{colors.GREEN}✓ RESULT: PASS (Time: {result['duration']:.1f}s){colors.NC}\n\n"
+        # Any failure status
+        text += f"{colors.RED}✗ RESULT: {status.upper().replace('_', ' ')} (Time: {result['duration']:.1f}s){colors.NC}\n"
+        if result['error_message']:
+            text += f"   {result['error_message']}\n"
+        if result.get('diff'):
+            text += f"{colors.YELLOW}Expected vs Actual diff:{colors.NC}\n{result['diff']}\n"
+        return 'failed', text + "\n"
+
+    prefix = f"{action} {name} ... "
+    if status == 'skip':
+        return 'skipped', prefix + f"{colors.YELLOW}⚠ SKIP: {name} ({result['error_message']}){colors.NC}\n"
+    if status == 'benchmark_complete':
+        return 'completed', prefix + f"{colors.GREEN}✓ {result['duration']:.3f}s{colors.NC}\n"
+    if status == 'pass':
+        return 'passed', prefix + f"{colors.GREEN}✓ PASS ({result['duration']:.1f}s){colors.NC}\n"
+    return 'failed', prefix + f"{colors.RED}✗ {status.upper().replace('_', ' ')} ({result['duration']:.1f}s){colors.NC}\n"
+
+def run_tests(test_type=None, verbose=False, benchmark=False, jobs=None, javac_process=None,
+              batch_size=None):
+    """Run all tests and return summary (None if compilation failed)"""
     if benchmark:
         log_info("Starting benchmark execution...")
         log_warning("Benchmark mode: measuring execution times only, no output comparison")
@@ -234,6 +662,8 @@ def run_tests(test_type=None, verbose=False, benchmark=False):
     # Get test files
     input_files = get_test_files(test_type)
     if not input_files:
+        if javac_process is not None:
+            finish_compile(javac_process)
         log_warning("⚠ No test cases found")
         return {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'completed': 0}
     
@@ -249,62 +679,105 @@ def run_tests(test_type=None, verbose=False, benchmark=False):
     
     # Ensure output directory exists
     ensure_directory(OUTPUT_DIR)
-    
+
+    # Each test runs the JVM as an independent process writing to its own
+    # output file, so test cases can safely run in parallel. Benchmark mode
+    # stays single-process by default because concurrent runs perturb timing;
+    # pass an explicit --jobs to override.
+    if jobs is None:
+        jobs = 1 if benchmark else (os.cpu_count() or 1)
+
+    # Each task is one worker-sized slice of the test list: a single case
+    # normally, or a BatchMain chunk when --batch-size is given. Clamp the
+    # size so a bad value can never produce an empty task list (which would
+    # report success while running nothing).
+    chunk_size = max(1, batch_size or 1)
+    tasks = [(start, input_files[start:start + chunk_size])
+             for start in range(0, len(input_files), chunk_size)]
+    jobs = max(1, min(jobs, len(tasks)))
+
     # Run tests
-    results = []
-    passed = 0
-    failed = 0
-    skipped = 0
-    completed = 0  # For benchmark mode
-    
-    for i, input_file in enumerate(input_files, 1):
-        result = run_single_test(input_file, verbose, benchmark)
-        results.append(result)
-        
-        if verbose:
-            action = "Benchmarking" if benchmark else "Testing"
-            print(f"{colors.BLUE}[{i}] {action}: {result['name']}{colors.NC}")
-        else:
-            action = "Benchmarking" if benchmark else "Testing"
-            print(f"{action} {result['name']} ... ", end='', flush=True)
-        
-        if result['status'] == 'skip':
-            if verbose:
-                log_warning(f"⚠ SKIP: {result['error_message']}")
-                print()
-            else:
-                log_warning(f"⚠ SKIP: {result['name']} ({result['error_message']})")
-            skipped += 1
-            
-        elif result['status'] == 'benchmark_complete':
-            if verbose:
-                log_success(f"✓ COMPLETED (Time: {result['duration']:.3f}s)")
-                print()
-            else:
-                log_success(f"✓ {result['duration']:.3f}s")
-            completed += 1
-            
-        elif result['status'] == 'pass':
-            if verbose:
-                log_success(f"✓ RESULT: PASS (Time: {result['duration']:.1f}s)")
-                print()
-            else:
-                log_success(f"✓ PASS ({result['duration']:.1f}s)")
-            passed += 1
-            
-        else:  # Any failure status
-            failed += 1
-            if verbose:
-                log_error(f"✗ RESULT: {result['status'].upper().replace('_', ' ')} (Time: {result['duration']:.1f}s)")
-                if result['error_message']:
-                    print(f"   {result['error_message']}")
-                if result.get('diff'):
-                    log_warning("Expected vs Actual diff:")
-                    print(result['diff'])
-                print()
-            else:
-                log_error(f"✗ {result['status'].upper().replace('_', ' ')} ({result['duration']:.1f}s)")
-    
+    if benchmark:
+        init_bench_root()  # Before the pool forks, so workers inherit it
+    cache = load_cache()
+    expected_names = get_expected_names()
+    results = [None] * len(input_files)
+    counts = {'passed': 0, 'failed': 0, 'skipped': 0, 'completed': 0}
+
+    # Progress lines are buffered and written in batches — one stdout write
+    # per 8 completions or 100ms instead of 2-3 syscalls per test
+    output_buffer = []
+    last_flush = time.monotonic()
+
+    def flush_output():
+        nonlocal last_flush
+        if output_buffer:
+            sys.stdout.write(''.join(output_buffer))
+            sys.stdout.flush()
+            output_buffer.clear()
+        last_flush = time.monotonic()
+
+    def record_result(i, result):
+        results[i] = result
+        if 'cache_update' in result:
+            update = result.pop('cache_update')
+            cache[update[0]] = update[1:]
+        category, text = format_result(i + 1, result, verbose, benchmark)
+        counts[category] += 1
+        output_buffer.append(text)
+        if len(output_buffer) >= 8 or time.monotonic() - last_flush >= 0.1:
+            flush_output()
+
+    def record_task_results(start, task_results):
+        for offset, result in enumerate(task_results):
+            record_result(start + offset, result)
+
+    if jobs == 1:
+        if javac_process is not None and not finish_compile(javac_process):
+            return None
+        for start, chunk in tasks:
+            record_task_results(start, run_task(chunk, verbose, benchmark,
+                                                cache, expected_names, batch_size))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Fork the pool workers while javac may still be running; the
+            # warmup submissions only start worker processes, so nothing
+            # touches the .class files until compilation is confirmed below.
+            for _ in range(jobs):
+                executor.submit(os.getpid)
+            if javac_process is not None and not finish_compile(javac_process):
+                return None
+            futures = {executor.submit(run_task, chunk, verbose, benchmark,
+                                       cache, expected_names, batch_size): start
+                       for start, chunk in tasks}
+            # All progress printing happens here in the parent process, so
+            # completed lines never interleave mid-escape-code. The wait uses
+            # a stepped backoff: 50ms while results are flowing, doubling up
+            # to 200ms while long-running tests leave nothing to report.
+            pending = set(futures)
+            poll_interval = 0.05
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=poll_interval,
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+                if done:
+                    poll_interval = 0.05
+                    for future in done:
+                        record_task_results(futures[future], future.result())
+                else:
+                    # Nothing completed: push out any buffered progress lines
+                    # so finished tests stay visible while slow ones run
+                    flush_output()
+                    poll_interval = min(poll_interval * 2, 0.2)
+
+    flush_output()
+    save_cache(cache)
+
+    passed = counts['passed']
+    failed = counts['failed']
+    skipped = counts['skipped']
+    completed = counts['completed']
+
     # Print summary
     if verbose:
         print("========================================")
@@ -370,31 +843,72 @@ def run_tests(test_type=None, verbose=False, benchmark=False):
     }
 
 def clean_outputs():
-    """Clean generated output files automatically"""
-    import glob
-    
-    # Remove old .class files
-    for f in glob.glob(os.path.join(SRC_DIR, "*.class")):
-        try:
-            os.remove(f)
-        except:
-            pass
-    
+    """Clean generated output files automatically.
+
+    Compiled .class files are deliberately left alone so start_compile() can
+    skip javac entirely when the sources have not changed.
+    """
     # Remove old output files
     ensure_directory(OUTPUT_DIR)
-    for f in glob.glob(os.path.join(OUTPUT_DIR, "*.txt")):
-        try:
-            os.remove(f)
-        except:
-            pass
+    for entry in os.scandir(OUTPUT_DIR):
+        if entry.is_file() and entry.name.endswith(".txt"):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
 
-def main():
+def positive_int(value):
+    """argparse type for flags that must be a positive integer"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def build_parser():
+    """Build the full argparse parser (used for --help and odd invocations)"""
     parser = argparse.ArgumentParser(description="Nightpass Survivor Test Runner")
     parser.add_argument('--type', choices=['type1', 'type2'], help='Filter tests by type (type1 or type2)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output and diffs')
     parser.add_argument('--benchmark', '-b', action='store_true', help='Benchmark mode: only measure execution times, no output comparison')
-    
-    args = parser.parse_args()
+    parser.add_argument('--jobs', '-j', type=positive_int, help='Number of test cases to run in parallel (default: CPU count, or 1 in benchmark mode)')
+    parser.add_argument('--batch-size', type=positive_int, help='Run test cases in batches of N per JVM invocation instead of one warm JVM per worker')
+    return parser
+
+def parse_args():
+    """Parse command-line flags.
+
+    Constructing the argparse parser costs several milliseconds, which adds
+    up when the runner is invoked in a loop by another harness, so the known
+    flags are matched with a plain argv scan. --help and anything this scan
+    does not recognize fall through to the full parser for proper messages.
+    """
+    args = argparse.Namespace(type=None, verbose=False, benchmark=False, jobs=None,
+                              batch_size=None)
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        flag = argv[i]
+        if flag in ('--verbose', '-v'):
+            args.verbose = True
+            i += 1
+        elif flag in ('--benchmark', '-b'):
+            args.benchmark = True
+            i += 1
+        elif flag == '--type' and i + 1 < len(argv) and argv[i + 1] in ('type1', 'type2'):
+            args.type = argv[i + 1]
+            i += 2
+        elif flag in ('--jobs', '-j') and i + 1 < len(argv) and argv[i + 1].isdigit() and int(argv[i + 1]) >= 1:
+            args.jobs = int(argv[i + 1])
+            i += 2
+        elif flag == '--batch-size' and i + 1 < len(argv) and argv[i + 1].isdigit() and int(argv[i + 1]) >= 1:
+            args.batch_size = int(argv[i + 1])
+            i += 2
+        else:
+            return build_parser().parse_args()
+    return args
+
+def main():
+    args = parse_args()
     
     # Change to script directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -405,14 +919,20 @@ def main():
     
     # Always clean before testing
     clean_outputs()
-    
-    # Compile Java sources
-    if not compile_java():
+
+    # Start compiling Java sources in the background; run_tests overlaps its
+    # own setup (test discovery, cache load, worker-pool warmup) with javac
+    # and waits for the result just before the first test runs.
+    javac_process = start_compile()
+    if javac_process is None:
         sys.exit(1)
-    
+
     # Run tests and grade
-    summary = run_tests(args.type, args.verbose, args.benchmark)
-    
+    summary = run_tests(args.type, args.verbose, args.benchmark, args.jobs, javac_process,
+                        args.batch_size)
+    if summary is None:
+        sys.exit(1)
+
     # Exit with appropriate code
     if args.benchmark:
         # In benchmark mode, success if any tests completed